@@ -5,7 +5,7 @@ use rust_decimal::prelude::ToPrimitive;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 
-use crate::types::{Side, TradingPair};
+use crate::types::TradingPair;
 use crate::web::state::TradeRecord;
 
 /// Comprehensive performance analytics
@@ -148,27 +148,90 @@ pub struct WinLossStreaks {
     pub avg_loss_streak: Decimal,
 }
 
+/// Win/loss totals accumulated in a single pass over a set of trades
+#[derive(Debug, Default)]
+struct WinLossTotals {
+    trades: u64,
+    wins: u64,
+    losses: u64,
+    total_pnl: Decimal,
+    gross_profit: Decimal,
+    gross_loss: Decimal, // Sum of losing pnl (negative)
+    win_pct_sum: Decimal,
+    loss_pct_sum: Decimal,
+    largest_win: Decimal,
+    largest_loss: Decimal,
+}
+
+impl WinLossTotals {
+    fn add(&mut self, trade: &TradeRecord) {
+        self.trades += 1;
+        self.total_pnl += trade.pnl;
+        if trade.pnl > Decimal::ZERO {
+            self.wins += 1;
+            self.gross_profit += trade.pnl;
+            self.win_pct_sum += trade.pnl_pct;
+            self.largest_win = self.largest_win.max(trade.pnl);
+        } else if trade.pnl < Decimal::ZERO {
+            self.losses += 1;
+            self.gross_loss += trade.pnl;
+            self.loss_pct_sum += trade.pnl_pct;
+            self.largest_loss = self.largest_loss.min(trade.pnl);
+        }
+    }
+
+    fn win_rate(&self) -> Decimal {
+        if self.trades > 0 {
+            Decimal::from(self.wins) / Decimal::from(self.trades) * dec!(100)
+        } else {
+            Decimal::ZERO
+        }
+    }
+
+    fn avg_win(&self) -> Decimal {
+        Self::mean(self.gross_profit, self.wins)
+    }
+
+    fn avg_loss(&self) -> Decimal {
+        Self::mean(self.gross_loss, self.losses)
+    }
+
+    fn mean(sum: Decimal, count: u64) -> Decimal {
+        if count > 0 {
+            sum / Decimal::from(count)
+        } else {
+            Decimal::ZERO
+        }
+    }
+}
+
 /// Calculate comprehensive analytics from trade history
 pub struct AnalyticsCalculator;
 
 impl AnalyticsCalculator {
+    /// Takes ownership of the trade history so it can be sorted in place
+    /// rather than copied first
     pub fn calculate(
-        trades: &[TradeRecord],
+        mut trades: Vec<TradeRecord>,
         initial_capital: Decimal,
         current_equity: Decimal,
     ) -> PerformanceAnalytics {
         // CRITICAL: Sort trades by timestamp for correct equity curve and drawdown analysis
-        let mut sorted_trades = trades.to_vec();
-        sorted_trades.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
-
-        let overall = Self::calculate_overall_metrics(&sorted_trades, initial_capital, current_equity);
-        let by_pair = Self::calculate_pair_metrics(&sorted_trades);
-        let by_strategy = Self::calculate_strategy_metrics(&sorted_trades);
-        let rolling_returns = Self::calculate_rolling_returns(&sorted_trades, initial_capital);
-        let drawdown_analysis = Self::calculate_drawdown_analysis(&sorted_trades, initial_capital);
-        let trade_distribution = Self::calculate_trade_distribution(&sorted_trades);
-        let risk_metrics = Self::calculate_risk_metrics(&sorted_trades, initial_capital, current_equity);
-        let win_loss_streaks = Self::calculate_win_loss_streaks(&sorted_trades);
+        trades.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
+
+        let overall = Self::calculate_overall_metrics(&trades, initial_capital, current_equity);
+        let by_pair = Self::calculate_pair_metrics(&trades);
+        let by_strategy = Self::calculate_strategy_metrics(&trades);
+        let rolling_returns = Self::calculate_rolling_returns(&trades, initial_capital);
+        let drawdown_analysis = Self::calculate_drawdown_analysis(&trades, initial_capital);
+        let trade_distribution = Self::calculate_trade_distribution(&trades);
+        let risk_metrics = Self::calculate_risk_metrics(
+            &trades,
+            initial_capital,
+            current_equity,
+            &drawdown_analysis,
+        );
+        let win_loss_streaks = Self::calculate_win_loss_streaks(&trades);
 
         PerformanceAnalytics {
             overall,
@@ -206,55 +269,33 @@ impl AnalyticsCalculator {
             };
         }
 
-        let total_trades = trades.len() as u64;
-        let winning_trades = trades.iter().filter(|t| t.pnl > Decimal::ZERO).count() as u64;
-        let losing_trades = trades.iter().filter(|t| t.pnl < Decimal::ZERO).count() as u64;
+        let mut totals = WinLossTotals::default();
+        for trade in trades {
+            totals.add(trade);
+        }
 
-        let win_rate = if total_trades > 0 {
-            Decimal::from(winning_trades) / Decimal::from(total_trades) * dec!(100)
-        } else {
-            Decimal::ZERO
-        };
+        let total_trades = totals.trades;
+        let winning_trades = totals.wins;
+        let losing_trades = totals.losses;
+        let win_rate = totals.win_rate();
 
-        let total_pnl: Decimal = trades.iter().map(|t| t.pnl).sum();
+        let total_pnl = totals.total_pnl;
         let total_pnl_pct = if initial_capital > Decimal::ZERO {
             (current_equity - initial_capital) / initial_capital * dec!(100)
         } else {
             Decimal::ZERO
         };
 
-        let wins: Vec<_> = trades.iter().filter(|t| t.pnl > Decimal::ZERO).collect();
-        let losses: Vec<_> = trades.iter().filter(|t| t.pnl < Decimal::ZERO).collect();
-
-        let avg_win = if !wins.is_empty() {
-            wins.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(wins.len())
-        } else {
-            Decimal::ZERO
-        };
-
-        let avg_loss = if !losses.is_empty() {
-            losses.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(losses.len())
-        } else {
-            Decimal::ZERO
-        };
-
-        let avg_win_pct = if !wins.is_empty() {
-            wins.iter().map(|t| t.pnl_pct).sum::<Decimal>() / Decimal::from(wins.len())
-        } else {
-            Decimal::ZERO
-        };
+        let avg_win = totals.avg_win();
+        let avg_loss = totals.avg_loss();
+        let avg_win_pct = WinLossTotals::mean(totals.win_pct_sum, totals.wins);
+        let avg_loss_pct = WinLossTotals::mean(totals.loss_pct_sum, totals.losses);
 
-        let avg_loss_pct = if !losses.is_empty() {
-            losses.iter().map(|t| t.pnl_pct).sum::<Decimal>() / Decimal::from(losses.len())
-        } else {
-            Decimal::ZERO
-        };
-
-        let largest_win = wins.iter().map(|t| t.pnl).max().unwrap_or(Decimal::ZERO);
-        let largest_loss = losses.iter().map(|t| t.pnl).min().unwrap_or(Decimal::ZERO);
+        let largest_win = totals.largest_win;
+        let largest_loss = totals.largest_loss;
 
-        let gross_profit: Decimal = wins.iter().map(|t| t.pnl).sum();
-        let gross_loss: Decimal = losses.iter().map(|t| t.pnl.abs()).sum();
+        let gross_profit = totals.gross_profit;
+        let gross_loss = totals.gross_loss.abs();
 
         let profit_factor = if gross_loss > Decimal::ZERO {
             gross_profit / gross_loss
@@ -291,32 +332,17 @@ impl AnalyticsCalculator {
     fn calculate_pair_metrics(trades: &[TradeRecord]) -> HashMap<TradingPair, PairMetrics> {
         let mut metrics: HashMap<TradingPair, PairMetrics> = HashMap::new();
 
-        let total_pnl: Decimal = trades.iter().map(|t| t.pnl).sum();
-
-        for pair in [
-            TradingPair::BTCUSDT,
-            TradingPair::ETHUSDT,
-            TradingPair::SOLUSDT,
-            TradingPair::BNBUSDT,
-            TradingPair::ADAUSDT,
-            TradingPair::XRPUSDT,
-        ] {
-            let pair_trades: Vec<_> = trades.iter().filter(|t| t.pair == pair).collect();
-
-            if pair_trades.is_empty() {
-                continue;
-            }
-
-            let trade_count = pair_trades.len() as u64;
-            let wins = pair_trades.iter().filter(|t| t.pnl > Decimal::ZERO).count() as u64;
-            let win_rate = if trade_count > 0 {
-                Decimal::from(wins) / Decimal::from(trade_count) * dec!(100)
-            } else {
-                Decimal::ZERO
-            };
+        // Group by pair, accumulating totals as we go
+        let mut total_pnl = Decimal::ZERO;
+        let mut pair_totals: HashMap<TradingPair, WinLossTotals> = HashMap::new();
+        for trade in trades {
+            total_pnl += trade.pnl;
+            pair_totals.entry(trade.pair).or_default().add(trade);
+        }
 
-            let pair_pnl: Decimal = pair_trades.iter().map(|t| t.pnl).sum();
-            let avg_pnl = pair_pnl / Decimal::from(trade_count);
+        for (pair, totals) in pair_totals {
+            let pair_pnl = totals.total_pnl;
+            let avg_pnl = pair_pnl / Decimal::from(totals.trades);
 
             let contribution_pct = if total_pnl != Decimal::ZERO {
                 pair_pnl / total_pnl * dec!(100)
@@ -324,26 +350,8 @@ impl AnalyticsCalculator {
                 Decimal::ZERO
             };
 
-            // Calculate avg_win, avg_loss, and profit_factor
-            let winning_trades: Vec<_> = pair_trades.iter().filter(|t| t.pnl > Decimal::ZERO).collect();
-            let losing_trades: Vec<_> = pair_trades.iter().filter(|t| t.pnl < Decimal::ZERO).collect();
-
-            let avg_win = if !winning_trades.is_empty() {
-                winning_trades.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(winning_trades.len())
-            } else {
-                Decimal::ZERO
-            };
-
-            let avg_loss = if !losing_trades.is_empty() {
-                losing_trades.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(losing_trades.len())
-            } else {
-                Decimal::ZERO
-            };
-
-            let total_wins: Decimal = winning_trades.iter().map(|t| t.pnl).sum();
-            let total_losses: Decimal = losing_trades.iter().map(|t| t.pnl).sum();
-            let profit_factor = if total_losses.abs() > Decimal::ZERO {
-                total_wins / total_losses.abs()
+            let profit_factor = if totals.gross_loss.abs() > Decimal::ZERO {
+                totals.gross_profit / totals.gross_loss.abs()
             } else {
                 Decimal::ZERO
             };
@@ -352,13 +360,13 @@ impl AnalyticsCalculator {
                 pair,
                 PairMetrics {
                     pair,
-                    trades: trade_count,
-                    win_rate,
+                    trades: totals.trades,
+                    win_rate: totals.win_rate(),
                     total_pnl: pair_pnl,
                     avg_pnl,
                     contribution_pct,
-                    avg_win,
-                    avg_loss,
+                    avg_win: totals.avg_win(),
+                    avg_loss: totals.avg_loss(),
                     profit_factor,
                 },
             );
@@ -370,62 +378,33 @@ impl AnalyticsCalculator {
     fn calculate_strategy_metrics(trades: &[TradeRecord]) -> HashMap<String, StrategyMetrics> {
         let mut metrics: HashMap<String, StrategyMetrics> = HashMap::new();
 
-        // Group by strategy
-        let mut strategy_groups: HashMap<String, Vec<&TradeRecord>> = HashMap::new();
+        // Group by strategy, accumulating totals as we go
+        let mut strategy_totals: HashMap<&str, WinLossTotals> = HashMap::new();
         for trade in trades {
-            strategy_groups
-                .entry(trade.strategy.clone())
-                .or_insert_with(Vec::new)
-                .push(trade);
+            strategy_totals.entry(trade.strategy.as_str()).or_default().add(trade);
         }
 
-        for (strategy, strat_trades) in strategy_groups {
-            let trade_count = strat_trades.len() as u64;
-            let wins = strat_trades.iter().filter(|t| t.pnl > Decimal::ZERO).count() as u64;
-            let win_rate = if trade_count > 0 {
-                Decimal::from(wins) / Decimal::from(trade_count) * dec!(100)
-            } else {
-                Decimal::ZERO
-            };
-
-            let strat_pnl: Decimal = strat_trades.iter().map(|t| t.pnl).sum();
-            let avg_pnl = strat_pnl / Decimal::from(trade_count);
+        for (strategy, totals) in strategy_totals {
+            let strat_pnl = totals.total_pnl;
+            let avg_pnl = strat_pnl / Decimal::from(totals.trades);
 
-            // Calculate avg_win, avg_loss, and profit_factor
-            let winning_trades: Vec<_> = strat_trades.iter().filter(|t| t.pnl > Decimal::ZERO).collect();
-            let losing_trades: Vec<_> = strat_trades.iter().filter(|t| t.pnl < Decimal::ZERO).collect();
-
-            let avg_win = if !winning_trades.is_empty() {
-                winning_trades.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(winning_trades.len())
-            } else {
-                Decimal::ZERO
-            };
-
-            let avg_loss = if !losing_trades.is_empty() {
-                losing_trades.iter().map(|t| t.pnl).sum::<Decimal>() / Decimal::from(losing_trades.len())
-            } else {
-                Decimal::ZERO
-            };
-
-            let total_wins: Decimal = winning_trades.iter().map(|t| t.pnl).sum();
-            let total_losses: Decimal = losing_trades.iter().map(|t| t.pnl).sum();
-            let profit_factor = if total_losses.abs() > Decimal::ZERO {
-                total_wins / total_losses.abs()
+            let profit_factor = if totals.gross_loss.abs() > Decimal::ZERO {
+                totals.gross_profit / totals.gross_loss.abs()
             } else {
                 Decimal::ZERO
             };
 
             metrics.insert(
-                strategy.clone(),
+                strategy.to_string(),
                 StrategyMetrics {
-                    strategy,
-                    trades: trade_count,
-                    win_rate,
+                    strategy: strategy.to_string(),
+                    trades: totals.trades,
+                    win_rate: totals.win_rate(),
                     total_pnl: strat_pnl,
                     avg_pnl,
                     sharpe_ratio: None, // TODO: Calculate per-strategy Sharpe
-                    avg_win,
-                    avg_loss,
+                    avg_win: totals.avg_win(),
+                    avg_loss: totals.avg_loss(),
                     profit_factor,
                 },
             );
@@ -446,7 +425,8 @@ impl AnalyticsCalculator {
         }
 
         // Build equity curve to find equity at various points in time
-        let mut equity_at_time: Vec<(DateTime<Utc>, Decimal)> = vec![(trades[0].timestamp, initial_capital)];
+        let mut equity_at_time: Vec<(DateTime<Utc>, Decimal)> = Vec::with_capacity(trades.len() + 1);
+        equity_at_time.push((trades[0].timestamp, initial_capital));
         let mut running_equity = initial_capital;
 
         for trade in trades {
@@ -464,12 +444,11 @@ impl AnalyticsCalculator {
         let date_90d_ago = reference_date - Duration::days(90);
 
         // Helper function to find equity at a specific date
+        // (equity_at_time is in timestamp order, so binary search for the last point <= target)
         let find_equity_at = |target_date: DateTime<Utc>| -> Decimal {
-            equity_at_time
-                .iter()
-                .filter(|(date, _)| *date <= target_date)
-                .last()
-                .map(|(_, equity)| *equity)
+            let idx = equity_at_time.partition_point(|(date, _)| *date <= target_date);
+            idx.checked_sub(1)
+                .map(|i| equity_at_time[i].1)
                 .unwrap_or(initial_capital)
         };
 
@@ -697,6 +676,7 @@ impl AnalyticsCalculator {
         trades: &[TradeRecord],
         initial_capital: Decimal,
         current_equity: Decimal,
+        dd_analysis: &DrawdownAnalysis,
     ) -> RiskMetrics {
         if trades.is_empty() {
             return RiskMetrics {
@@ -767,9 +747,6 @@ impl AnalyticsCalculator {
         let volatility = Decimal::from_f64_retain(std_dev * 100.0 * annualization_factor)
             .unwrap_or(Decimal::ZERO);
 
-        // Max drawdown
-        let dd_analysis = Self::calculate_drawdown_analysis(trades, initial_capital);
-
         // Calmar Ratio (return / max drawdown)
         let total_return = (current_equity - initial_capital) / initial_capital * dec!(100);
         let calmar_ratio = if dd_analysis.max_drawdown > Decimal::ZERO {
@@ -875,3 +852,120 @@ impl AnalyticsCalculator {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::types::Side;
+
+    fn trade(pair: TradingPair, strategy: &str, pnl: Decimal, pnl_pct: Decimal) -> TradeRecord {
+        TradeRecord {
+            id: String::new(),
+            timestamp: Utc::now(),
+            pair,
+            side: Side::Buy,
+            quantity: Decimal::ONE,
+            entry_price: dec!(100),
+            exit_price: None,
+            pnl,
+            pnl_pct,
+            fees: Decimal::ZERO,
+            strategy: strategy.to_string(),
+            exit_reason: None,
+            status: "Closed".to_string(),
+        }
+    }
+
+    fn sample_trades() -> Vec<TradeRecord> {
+        vec![
+            trade(TradingPair::BTCUSDT, "A", dec!(10), dec!(1)),
+            trade(TradingPair::BTCUSDT, "A", dec!(-5), dec!(-0.5)),
+            trade(TradingPair::BTCUSDT, "A", dec!(0), dec!(0)),
+            trade(TradingPair::BTCUSDT, "B", dec!(20), dec!(2)),
+            trade(TradingPair::ETHUSDT, "B", dec!(30), dec!(3)),
+            trade(TradingPair::ETHUSDT, "B", dec!(-15), dec!(-1.5)),
+            trade(TradingPair::ETHUSDT, "A", dec!(6), dec!(0.6)),
+            trade(TradingPair::SOLUSDT, "C", dec!(8), dec!(0.8)),
+        ]
+    }
+
+    #[test]
+    fn test_overall_metrics() {
+        let trades = sample_trades();
+        let overall = AnalyticsCalculator::calculate_overall_metrics(&trades, dec!(1000), dec!(1054));
+
+        assert_eq!(overall.total_trades, 8);
+        assert_eq!(overall.winning_trades, 5);
+        assert_eq!(overall.losing_trades, 2);
+        assert_eq!(overall.win_rate, dec!(62.5));
+        assert_eq!(overall.total_pnl, dec!(54));
+        assert_eq!(overall.avg_win, dec!(14.8));
+        assert_eq!(overall.avg_loss, dec!(-10));
+        assert_eq!(overall.avg_win_pct, dec!(1.48));
+        assert_eq!(overall.avg_loss_pct, dec!(-1));
+        assert_eq!(overall.largest_win, dec!(30));
+        assert_eq!(overall.largest_loss, dec!(-15));
+        assert_eq!(overall.profit_factor, dec!(3.7));
+
+        // Overall metrics cap a loss-free profit factor at 999.99
+        let wins_only = vec![trade(TradingPair::BTCUSDT, "A", dec!(5), dec!(0.5))];
+        let overall = AnalyticsCalculator::calculate_overall_metrics(&wins_only, dec!(1000), dec!(1005));
+        assert_eq!(overall.avg_loss, Decimal::ZERO);
+        assert_eq!(overall.largest_loss, Decimal::ZERO);
+        assert_eq!(overall.profit_factor, dec!(999.99));
+    }
+
+    #[test]
+    fn test_pair_metrics() {
+        let by_pair = AnalyticsCalculator::calculate_pair_metrics(&sample_trades());
+        assert_eq!(by_pair.len(), 3);
+
+        let btc = &by_pair[&TradingPair::BTCUSDT];
+        assert_eq!(btc.trades, 4);
+        assert_eq!(btc.win_rate, dec!(50));
+        assert_eq!(btc.total_pnl, dec!(25));
+        assert_eq!(btc.avg_win, dec!(15));
+        assert_eq!(btc.avg_loss, dec!(-5));
+        assert_eq!(btc.profit_factor, dec!(6));
+        assert_eq!(btc.contribution_pct, dec!(25) / dec!(54) * dec!(100));
+
+        let eth = &by_pair[&TradingPair::ETHUSDT];
+        assert_eq!(eth.trades, 3);
+        assert_eq!(eth.win_rate, Decimal::from(2) / Decimal::from(3) * dec!(100));
+        assert_eq!(eth.avg_win, dec!(18));
+        assert_eq!(eth.avg_loss, dec!(-15));
+        assert_eq!(eth.profit_factor, dec!(2.4));
+
+        // Grouped metrics report zero profit factor when a group has no losses
+        let sol = &by_pair[&TradingPair::SOLUSDT];
+        assert_eq!(sol.win_rate, dec!(100));
+        assert_eq!(sol.avg_win, dec!(8));
+        assert_eq!(sol.avg_loss, Decimal::ZERO);
+        assert_eq!(sol.profit_factor, Decimal::ZERO);
+    }
+
+    #[test]
+    fn test_strategy_metrics() {
+        let by_strategy = AnalyticsCalculator::calculate_strategy_metrics(&sample_trades());
+        assert_eq!(by_strategy.len(), 3);
+
+        let a = &by_strategy["A"];
+        assert_eq!(a.strategy, "A");
+        assert_eq!(a.trades, 4);
+        assert_eq!(a.win_rate, dec!(50));
+        assert_eq!(a.avg_win, dec!(8));
+        assert_eq!(a.avg_loss, dec!(-5));
+        assert_eq!(a.profit_factor, dec!(3.2));
+
+        let b = &by_strategy["B"];
+        assert_eq!(b.trades, 3);
+        assert_eq!(b.avg_win, dec!(25));
+        assert_eq!(b.avg_loss, dec!(-15));
+        assert_eq!(b.profit_factor, dec!(50) / dec!(15));
+
+        let c = &by_strategy["C"];
+        assert_eq!(c.win_rate, dec!(100));
+        assert_eq!(c.avg_loss, Decimal::ZERO);
+        assert_eq!(c.profit_factor, Decimal::ZERO);
+    }
+}
@@ -1,7 +1,8 @@
 use anyhow::Result;
 use chrono::{DateTime, Utc};
 use rust_decimal::Decimal;
-use sqlx::sqlite::{SqliteConnectOptions, SqlitePool, SqlitePoolOptions};
+use sqlx::query::Query;
+use sqlx::sqlite::{SqliteArguments, SqliteConnectOptions, SqlitePool, SqlitePoolOptions};
 use sqlx::{Row, Sqlite};
 use std::path::Path;
 use std::str::FromStr;
@@ -232,6 +233,25 @@ impl Database {
 
     /// Insert a trade record
     pub async fn insert_trade(&self, trade: &TradeRecord) -> Result<()> {
+        Self::insert_trade_query(trade).execute(&self.pool).await?;
+
+        Ok(())
+    }
+
+    /// Insert a batch of trades in a single transaction
+    pub async fn insert_trades(&self, trades: &[TradeRecord]) -> Result<()> {
+        let mut tx = self.pool.begin().await?;
+
+        for trade in trades {
+            Self::insert_trade_query(trade).execute(&mut *tx).await?;
+        }
+
+        tx.commit().await?;
+
+        Ok(())
+    }
+
+    fn insert_trade_query(trade: &TradeRecord) -> Query<'_, Sqlite, SqliteArguments<'_>> {
         sqlx::query(
             r#"
             INSERT INTO trades (
@@ -253,10 +273,6 @@ impl Database {
         .bind(&trade.strategy)
         .bind(&trade.exit_reason)
         .bind(&trade.status)
-        .execute(&self.pool)
-        .await?;
-
-        Ok(())
     }
 
     /// Get all trades (for analytics)
@@ -3,12 +3,12 @@ use chrono::{DateTime, NaiveDate, NaiveTime, Utc};
 use rust_decimal::Decimal;
 use rust_decimal_macros::dec;
 use std::collections::HashMap;
-use tracing::{debug, info, warn};
+use tracing::{debug, info};
 use uuid::Uuid;
 
 use crate::exchange::BinanceClient;
 use crate::strategies::{ImprovedStrategy, Strategy, StrategySignal, create_improved_strategy};
-use crate::types::{Candle, CandleBuffer, Position, PositionStatus, Side, Signal, TimeFrame, TradingPair};
+use crate::types::{Candle, CandleBuffer, Position, PositionStatus, Side, TimeFrame, TradingPair};
 
 use super::results::{BacktestResults, EquityPoint, ExitReason, MetricsCalculator, TradeRecord};
 use super::Portfolio;
@@ -50,7 +50,6 @@ impl Default for BacktestConfig {
 /// Core backtesting engine
 pub struct BacktestEngine {
     config: BacktestConfig,
-    exchange: BinanceClient,
     portfolio: Portfolio,
     strategies: HashMap<TradingPair, ImprovedStrategy>,
     candle_buffers: HashMap<TradingPair, CandleBuffer>,
@@ -77,7 +76,6 @@ impl BacktestEngine {
 
         Self {
             config,
-            exchange: BinanceClient::public_only(),
             portfolio,
             strategies,
             candle_buffers,
@@ -91,21 +89,27 @@ impl BacktestEngine {
 
     /// Main entry point for running backtest
     pub async fn run(&mut self) -> Result<BacktestResults> {
+        // 1. Fetch all historical data
+        let historical_data = Self::fetch_all_historical_data(&self.config).await?;
+
+        self.run_on_data(&historical_data)
+    }
+
+    /// Run the backtest over candles that were already fetched, so several
+    /// configurations covering the same period can share one download
+    pub fn run_on_data(&mut self, historical_data: &HashMap<TradingPair, Vec<Candle>>) -> Result<BacktestResults> {
         info!(
             "Starting backtest: {} to {} with ${:.2}",
             self.config.start_date, self.config.end_date, self.config.initial_capital
         );
 
-        // 1. Fetch all historical data
-        let historical_data = self.fetch_all_historical_data().await?;
-
         // 2. Merge and sort candles chronologically
-        let timeline = self.create_timeline(&historical_data);
+        let timeline = self.create_timeline(historical_data);
         info!("Processing {} candles in timeline", timeline.len());
 
         // 3. Process each candle in order
         for candle in timeline {
-            self.process_candle(candle)?;
+            self.process_candle(candle.clone())?;
         }
 
         // 4. Close any remaining positions at end
@@ -131,25 +135,23 @@ impl BacktestEngine {
         Ok(results)
     }
 
-    async fn fetch_all_historical_data(&self) -> Result<HashMap<TradingPair, Vec<Candle>>> {
+    pub async fn fetch_all_historical_data(config: &BacktestConfig) -> Result<HashMap<TradingPair, Vec<Candle>>> {
+        let exchange = BinanceClient::public_only();
         let mut data = HashMap::new();
 
-        let start = self
-            .config
+        let start = config
             .start_date
             .and_time(NaiveTime::from_hms_opt(0, 0, 0).unwrap())
             .and_utc();
-        let end = self
-            .config
+        let end = config
             .end_date
             .and_time(NaiveTime::from_hms_opt(23, 59, 59).unwrap())
             .and_utc();
 
-        for pair in &self.config.pairs {
+        for pair in &config.pairs {
             info!("Fetching historical data for {}...", pair);
-            let candles = self
-                .exchange
-                .get_historical_candles(*pair, self.config.timeframe, start, end)
+            let candles = exchange
+                .get_historical_candles(*pair, config.timeframe, start, end)
                 .await?;
             info!("Fetched {} candles for {}", candles.len(), pair);
             data.insert(*pair, candles);
@@ -158,12 +160,18 @@ impl BacktestEngine {
         Ok(data)
     }
 
-    fn create_timeline(&self, data: &HashMap<TradingPair, Vec<Candle>>) -> Vec<Candle> {
+    /// Merge all pairs into one chronological timeline of references into `data`,
+    /// so sorting moves pointers instead of whole candles
+    fn create_timeline<'a>(&self, data: &'a HashMap<TradingPair, Vec<Candle>>) -> Vec<&'a Candle> {
+        let total: usize = self.config.pairs.iter()
+            .filter_map(|pair| data.get(pair).map(Vec::len))
+            .sum();
+
         // Iterate pairs in a fixed order to ensure determinism
-        let mut all_candles: Vec<Candle> = Vec::new();
+        let mut all_candles: Vec<&Candle> = Vec::with_capacity(total);
         for pair in &self.config.pairs {
             if let Some(candles) = data.get(pair) {
-                all_candles.extend(candles.iter().cloned());
+                all_candles.extend(candles.iter());
             }
         }
 
@@ -178,21 +186,22 @@ impl BacktestEngine {
     fn process_candle(&mut self, candle: Candle) -> Result<()> {
         let pair = candle.pair;
         let price = candle.close;
+        let timestamp = candle.open_time;
 
         // 1. Update current price
         self.current_prices.insert(pair, price);
 
         // 2. Update candle buffer for this pair
         if let Some(buffer) = self.candle_buffers.get_mut(&pair) {
-            buffer.push(candle.clone());
+            buffer.push(candle);
         }
 
         // 3. Update position prices and check stops
         self.portfolio.update_position_price(pair, price);
-        self.check_stops(pair, price, candle.open_time)?;
+        self.check_stops(pair, price, timestamp)?;
 
         // 4. Run strategy analysis
-        self.run_strategy(pair, price, candle.open_time)?;
+        self.run_strategy(pair, price, timestamp)?;
 
         // 5. Update drawdown
         self.portfolio.update_drawdown(&self.current_prices);
@@ -203,7 +212,7 @@ impl BacktestEngine {
             let equity = self.portfolio.total_equity(&self.current_prices);
             let drawdown = self.portfolio.max_drawdown;
             self.equity_curve.push(EquityPoint {
-                timestamp: candle.open_time,
+                timestamp,
                 equity,
                 drawdown_pct: drawdown,
             });
@@ -213,8 +222,10 @@ impl BacktestEngine {
     }
 
     fn run_strategy(&mut self, pair: TradingPair, price: Decimal, timestamp: DateTime<Utc>) -> Result<()> {
+        // Borrow the buffer in place; buffers and strategies are disjoint fields,
+        // so there is no need to copy the whole window on every candle
         let buffer = match self.candle_buffers.get(&pair) {
-            Some(b) => b.clone(),
+            Some(b) => b,
             None => return Ok(()),
         };
 
@@ -227,7 +238,7 @@ impl BacktestEngine {
             return Ok(());
         }
 
-        if let Some(signal) = strategy.analyze(&buffer) {
+        if let Some(signal) = strategy.analyze(buffer) {
             self.process_signal(signal, price, timestamp)?;
         }
 
@@ -3,11 +3,14 @@ use chrono::{DateTime, TimeZone, Utc};
 use hmac::{Hmac, Mac};
 use reqwest::Client;
 use rust_decimal::Decimal;
-use serde::{Deserialize, Serialize};
+use serde::de::{self, Deserializer, IgnoredAny, SeqAccess, Visitor};
+use serde::Deserialize;
 use sha2::Sha256;
 use std::collections::HashMap;
+use std::fmt;
+use std::marker::PhantomData;
 use std::str::FromStr;
-use tracing::{debug, info, warn};
+use tracing::{debug, info};
 
 use crate::types::{
     Candle, Order, OrderRequest, OrderStatus, OrderType, Side, Ticker, TimeFrame, TimeInForce, TradingPair,
@@ -15,6 +18,7 @@ use crate::types::{
 
 const BINANCE_US_API: &str = "https://api.binance.us";
 const BINANCE_US_TESTNET: &str = "https://testnet.binance.vision";
+const MAX_CANDLE_PREALLOCATION: u64 = 50_000; // Upper bound on candles reserved per fetch
 
 type HmacSha256 = Hmac<Sha256>;
 
@@ -116,39 +120,12 @@ impl BinanceClient {
             limit
         );
 
-        let resp: Vec<Vec<serde_json::Value>> = self.client.get(&url).send().await?.json().await?;
+        let body = self.client.get(&url).send().await?.bytes().await?;
+        let rows: Vec<KlineRow> = serde_json::from_slice(&body)?;
 
-        let candles: Result<Vec<Candle>> = resp
-            .into_iter()
-            .map(|k| {
-                let open_time = k.get(0).and_then(|v| v.as_i64()).unwrap_or(0);
-                let open = k.get(1).and_then(|v| v.as_str()).unwrap_or("0");
-                let high = k.get(2).and_then(|v| v.as_str()).unwrap_or("0");
-                let low = k.get(3).and_then(|v| v.as_str()).unwrap_or("0");
-                let close = k.get(4).and_then(|v| v.as_str()).unwrap_or("0");
-                let volume = k.get(5).and_then(|v| v.as_str()).unwrap_or("0");
-                let close_time = k.get(6).and_then(|v| v.as_i64()).unwrap_or(0);
-                let quote_volume = k.get(7).and_then(|v| v.as_str()).unwrap_or("0");
-                let trades = k.get(8).and_then(|v| v.as_u64()).unwrap_or(0);
-
-                Ok(Candle {
-                    pair,
-                    timeframe,
-                    open_time: Utc.timestamp_millis_opt(open_time).unwrap(),
-                    close_time: Utc.timestamp_millis_opt(close_time).unwrap(),
-                    open: Decimal::from_str(open)?,
-                    high: Decimal::from_str(high)?,
-                    low: Decimal::from_str(low)?,
-                    close: Decimal::from_str(close)?,
-                    volume: Decimal::from_str(volume)?,
-                    quote_volume: Decimal::from_str(quote_volume)?,
-                    trades,
-                    is_closed: true,
-                })
-            })
-            .collect();
-
-        candles
+        rows.into_iter()
+            .map(|row| row.into_candle(pair, timeframe))
+            .collect()
     }
 
     /// Fetches historical candles between two dates with automatic pagination.
@@ -160,10 +137,16 @@ impl BinanceClient {
         start_time: DateTime<Utc>,
         end_time: DateTime<Utc>,
     ) -> Result<Vec<Candle>> {
-        let mut all_candles = Vec::new();
         let mut current_start = start_time.timestamp_millis();
         let end_millis = end_time.timestamp_millis();
 
+        // Size the buffer for the range up front so pages append into one allocation.
+        // The estimate stops at the present (no candles exist beyond it) and is capped,
+        // since a range starting before a pair was listed can be mostly empty.
+        let estimate_end = end_millis.min(Utc::now().timestamp_millis());
+        let expected = (estimate_end - current_start).max(0) as u64 / timeframe.to_milliseconds() + 1;
+        let mut all_candles = Vec::with_capacity(expected.min(MAX_CANDLE_PREALLOCATION) as usize);
+
         info!(
             "Fetching historical candles for {} from {} to {}",
             pair, start_time, end_time
@@ -179,51 +162,23 @@ impl BinanceClient {
                 end_millis
             );
 
-            let resp: Vec<Vec<serde_json::Value>> = self.client.get(&url).send().await?.json().await?;
+            let body = self.client.get(&url).send().await?.bytes().await?;
+            let rows: Vec<KlineRow> = serde_json::from_slice(&body)?;
 
-            if resp.is_empty() {
+            if rows.is_empty() {
                 break;
             }
 
-            let batch_len = resp.len();
-
-            let batch: Result<Vec<Candle>> = resp
-                .into_iter()
-                .map(|k| {
-                    let open_time = k.get(0).and_then(|v| v.as_i64()).unwrap_or(0);
-                    let open = k.get(1).and_then(|v| v.as_str()).unwrap_or("0");
-                    let high = k.get(2).and_then(|v| v.as_str()).unwrap_or("0");
-                    let low = k.get(3).and_then(|v| v.as_str()).unwrap_or("0");
-                    let close = k.get(4).and_then(|v| v.as_str()).unwrap_or("0");
-                    let volume = k.get(5).and_then(|v| v.as_str()).unwrap_or("0");
-                    let close_time = k.get(6).and_then(|v| v.as_i64()).unwrap_or(0);
-                    let quote_volume = k.get(7).and_then(|v| v.as_str()).unwrap_or("0");
-                    let trades = k.get(8).and_then(|v| v.as_u64()).unwrap_or(0);
-
-                    Ok(Candle {
-                        pair,
-                        timeframe,
-                        open_time: Utc.timestamp_millis_opt(open_time).unwrap(),
-                        close_time: Utc.timestamp_millis_opt(close_time).unwrap(),
-                        open: Decimal::from_str(open)?,
-                        high: Decimal::from_str(high)?,
-                        low: Decimal::from_str(low)?,
-                        close: Decimal::from_str(close)?,
-                        volume: Decimal::from_str(volume)?,
-                        quote_volume: Decimal::from_str(quote_volume)?,
-                        trades,
-                        is_closed: true,
-                    })
-                })
-                .collect();
-
-            let candles = batch?;
-
-            if let Some(last) = candles.last() {
-                current_start = last.close_time.timestamp_millis() + 1;
+            let batch_len = rows.len();
+
+            // Parse straight into the output buffer rather than via a per-page Vec
+            for row in rows {
+                all_candles.push(row.into_candle(pair, timeframe)?);
             }
 
-            all_candles.extend(candles);
+            if let Some(last) = all_candles.last() {
+                current_start = last.close_time.timestamp_millis() + 1;
+            }
 
             // If we got fewer than 1000 candles, we've reached the end
             if batch_len < 1000 || current_start >= end_millis {
@@ -557,26 +512,87 @@ struct TickerResponse {
     low_price: String,
 }
 
-#[derive(Debug, Deserialize)]
-struct KlineResponse {
-    #[serde(rename = "0")]
-    open_time: i64,
-    #[serde(rename = "1")]
-    open: String,
-    #[serde(rename = "2")]
-    high: String,
-    #[serde(rename = "3")]
-    low: String,
-    #[serde(rename = "4")]
-    close: String,
-    #[serde(rename = "5")]
-    volume: String,
-    #[serde(rename = "6")]
-    close_time: i64,
-    #[serde(rename = "7")]
-    quote_volume: String,
-    #[serde(rename = "8")]
-    trades: u64,
+/// One row of /api/v3/klines. Binance sends each kline as a positional JSON
+/// array, so the row is decoded with a fixed schema and the numeric strings
+/// are borrowed from the response body instead of allocated per field.
+/// Malformed rows are errors rather than zero-filled candles: the first 9 columns
+/// must be present with the expected types, and every price must parse. Any
+/// further columns (taker volumes, and whatever Binance appends later) are skipped.
+#[derive(Debug)]
+struct KlineRow<'a>(
+    i64,     // open time
+    &'a str, // open
+    &'a str, // high
+    &'a str, // low
+    &'a str, // close
+    &'a str, // volume
+    i64,     // close time
+    &'a str, // quote asset volume
+    u64,     // number of trades
+);
+
+impl<'de: 'a, 'a> Deserialize<'de> for KlineRow<'a> {
+    fn deserialize<D: Deserializer<'de>>(deserializer: D) -> std::result::Result<Self, D::Error> {
+        struct RowVisitor<'a>(PhantomData<KlineRow<'a>>);
+
+        const EXPECTING: &str = "a kline array with at least 9 elements";
+
+        fn element<'de, T: Deserialize<'de>, A: SeqAccess<'de>>(
+            seq: &mut A,
+            index: usize,
+        ) -> std::result::Result<T, A::Error> {
+            seq.next_element()?
+                .ok_or_else(|| de::Error::invalid_length(index, &EXPECTING))
+        }
+
+        impl<'de: 'a, 'a> Visitor<'de> for RowVisitor<'a> {
+            type Value = KlineRow<'a>;
+
+            fn expecting(&self, f: &mut fmt::Formatter) -> fmt::Result {
+                f.write_str(EXPECTING)
+            }
+
+            fn visit_seq<A: SeqAccess<'de>>(self, mut seq: A) -> std::result::Result<Self::Value, A::Error> {
+                let row = KlineRow(
+                    element(&mut seq, 0)?,
+                    element(&mut seq, 1)?,
+                    element(&mut seq, 2)?,
+                    element(&mut seq, 3)?,
+                    element(&mut seq, 4)?,
+                    element(&mut seq, 5)?,
+                    element(&mut seq, 6)?,
+                    element(&mut seq, 7)?,
+                    element(&mut seq, 8)?,
+                );
+
+                // Drain the columns we don't use
+                while seq.next_element::<IgnoredAny>()?.is_some() {}
+
+                Ok(row)
+            }
+        }
+
+        deserializer.deserialize_seq(RowVisitor(PhantomData))
+    }
+}
+
+impl KlineRow<'_> {
+    fn into_candle(self, pair: TradingPair, timeframe: TimeFrame) -> Result<Candle> {
+        Ok(Candle {
+            pair,
+            timeframe,
+            open_time: Utc.timestamp_millis_opt(self.0).unwrap(),
+            close_time: Utc.timestamp_millis_opt(self.6).unwrap(),
+            open: Decimal::from_str(self.1)?,
+            high: Decimal::from_str(self.2)?,
+            low: Decimal::from_str(self.3)?,
+            close: Decimal::from_str(self.4)?,
+            volume: Decimal::from_str(self.5)?,
+            quote_volume: Decimal::from_str(self.7)?,
+            trades: self.8,
+            is_closed: true,
+        })
+    }
 }
 
 #[derive(Debug, Deserialize)]
@@ -625,3 +641,50 @@ struct BalanceResponse {
     free: String,
     locked: String,
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_kline_row_into_candle() {
+        let body = r#"[[1704067200000,"42283.58","42554.57","42261.02","42475.23","1271.68108",1704070799999,"53957457.28",47134,"682.57581","28957416.81","0"]]"#;
+        let rows: Vec<KlineRow> = serde_json::from_str(body).unwrap();
+        assert_eq!(rows.len(), 1);
+
+        let candle = rows.into_iter().next().unwrap().into_candle(TradingPair::BTCUSDT, TimeFrame::H1).unwrap();
+        assert_eq!(candle.open_time.timestamp_millis(), 1704067200000);
+        assert_eq!(candle.close_time.timestamp_millis(), 1704070799999);
+        assert_eq!(candle.close, Decimal::from_str("42475.23").unwrap());
+        assert_eq!(candle.quote_volume, Decimal::from_str("53957457.28").unwrap());
+        assert_eq!(candle.trades, 47134);
+    }
+
+    #[test]
+    fn test_kline_row_ignores_extra_columns() {
+        let body = r#"[[1704067200000,"1","2","0.5","1.5","10",1704070799999,"15",3,"1","1","0","extra",[1,2]]]"#;
+        let rows: Vec<KlineRow> = serde_json::from_str(body).unwrap();
+        assert_eq!(rows.len(), 1);
+
+        let candle = rows.into_iter().next().unwrap().into_candle(TradingPair::BTCUSDT, TimeFrame::H1).unwrap();
+        assert_eq!(candle.close, Decimal::from_str("1.5").unwrap());
+        assert_eq!(candle.trades, 3);
+    }
+
+    #[test]
+    fn test_kline_row_rejects_malformed_rows() {
+        // Missing one of the columns we need
+        let short = r#"[[1704067200000,"1","1","1","1","1",1704070799999,"1"]]"#;
+        assert!(serde_json::from_str::<Vec<KlineRow>>(short).is_err());
+
+        // Price sent as a number instead of a string
+        let wrong_type = r#"[[1704067200000,1.5,"1","1","1","1",1704070799999,"1",1,"1","1","0"]]"#;
+        assert!(serde_json::from_str::<Vec<KlineRow>>(wrong_type).is_err());
+
+        // Well-formed row whose price does not parse as a decimal
+        let bad_price = r#"[[1704067200000,"1","1","1","n/a","1",1704070799999,"1",1,"1","1","0"]]"#;
+        let rows: Vec<KlineRow> = serde_json::from_str(bad_price).unwrap();
+        let row = rows.into_iter().next().unwrap();
+        assert!(row.into_candle(TradingPair::BTCUSDT, TimeFrame::H1).is_err());
+    }
+}
@@ -8,7 +8,7 @@ use tokio::sync::mpsc;
 use tokio_tungstenite::{connect_async, tungstenite::Message};
 use tracing::{debug, error, info, warn};
 
-use crate::types::{Candle, Side, Ticker, TimeFrame, Trade, TradingPair};
+use crate::types::{Candle, Ticker, TimeFrame, Trade, TradingPair};
 
 const BINANCE_US_WS: &str = "wss://stream.binance.us:9443/ws";
 const BINANCE_US_STREAM: &str = "wss://stream.binance.us:9443/stream";
@@ -186,7 +186,7 @@ impl BinanceWebSocket {
     fn parse_message(text: &str) -> Option<MarketEvent> {
         // Try to parse as combined stream message first
         if let Ok(combined) = serde_json::from_str::<CombinedStreamMessage>(text) {
-            return Self::parse_stream_data(&combined.stream, &combined.data);
+            return Self::parse_stream_data(&combined.stream, combined.data);
         }
 
         // Try individual message types
@@ -216,24 +216,26 @@ impl BinanceWebSocket {
         None
     }
 
-    fn parse_stream_data(stream: &str, data: &serde_json::Value) -> Option<MarketEvent> {
+    /// Takes the payload by value so it can be deserialized in place instead
+    /// of cloning the whole JSON tree first
+    fn parse_stream_data(stream: &str, data: serde_json::Value) -> Option<MarketEvent> {
         if stream.contains("@ticker") {
-            let ticker: WsTickerMessage = serde_json::from_value(data.clone()).ok()?;
+            let ticker: WsTickerMessage = serde_json::from_value(data).ok()?;
             return Self::parse_ticker(&ticker);
         }
 
         if stream.contains("@kline") {
-            let kline: WsKlineMessage = serde_json::from_value(data.clone()).ok()?;
+            let kline: WsKlineMessage = serde_json::from_value(data).ok()?;
             return Self::parse_kline(&kline);
         }
 
         if stream.contains("@trade") {
-            let trade: WsTradeMessage = serde_json::from_value(data.clone()).ok()?;
+            let trade: WsTradeMessage = serde_json::from_value(data).ok()?;
             return Self::parse_trade(&trade);
         }
 
         if stream.contains("@bookTicker") {
-            let book: WsBookTickerMessage = serde_json::from_value(data.clone()).ok()?;
+            let book: WsBookTickerMessage = serde_json::from_value(data).ok()?;
             return Self::parse_book_ticker(&book);
         }
 
@@ -1,5 +1,5 @@
 use rust_decimal::Decimal;
-use super::{Indicator, stddev, sma};
+use super::{Indicator, stddev_with_mean, sma};
 
 #[derive(Debug, Clone)]
 pub struct BollingerBands {
@@ -42,7 +42,7 @@ impl BollingerBands {
         }
 
         let middle = sma(&self.prices, self.period)?;
-        let std_dev = stddev(&self.prices, self.period)?;
+        let std_dev = stddev_with_mean(&self.prices, self.period, middle)?;
 
         let deviation = std_dev * self.std_dev_multiplier;
         let upper = middle + deviation;
@@ -12,6 +12,7 @@ pub use bollinger::*;
 pub use atr::*;
 pub use volume::*;
 
+use rust_decimal::prelude::ToPrimitive;
 use rust_decimal::Decimal;
 
 pub trait Indicator {
@@ -42,11 +43,12 @@ pub fn lowest(values: &[Decimal], period: usize) -> Option<Decimal> {
     values.iter().rev().take(period).min().copied()
 }
 
-pub fn stddev(values: &[Decimal], period: usize) -> Option<Decimal> {
+/// Standard deviation around a mean the caller already has, so indicators
+/// that also need the SMA don't compute it twice
+pub fn stddev_with_mean(values: &[Decimal], period: usize, mean: Decimal) -> Option<Decimal> {
     if values.len() < period {
         return None;
     }
-    let mean = sma(values, period)?;
     let variance: Decimal = values
         .iter()
         .rev()
@@ -66,7 +68,12 @@ fn sqrt_decimal(value: Decimal) -> Decimal {
         return Decimal::ZERO;
     }
 
-    let mut guess = value / Decimal::from(2);
+    // Seed Newton's method from the f64 root so it converges in one or two steps
+    let mut guess = value
+        .to_f64()
+        .and_then(|v| Decimal::from_f64_retain(v.sqrt()))
+        .filter(|g| !g.is_zero())
+        .unwrap_or(value / Decimal::from(2));
     let epsilon = Decimal::new(1, 10); // 0.0000000001
 
     for _ in 0..50 {
@@ -78,3 +85,32 @@ fn sqrt_decimal(value: Decimal) -> Decimal {
     }
     guess
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_stddev_with_mean() {
+        let values: Vec<Decimal> = [2, 4, 4, 4, 5, 5, 7, 9].iter().map(|v| Decimal::from(*v)).collect();
+        let mean = sma(&values, 8).unwrap();
+
+        assert_eq!(mean, Decimal::from(5));
+        assert_eq!(stddev_with_mean(&values, 8, mean), Some(Decimal::from(2)));
+        assert_eq!(stddev_with_mean(&values, 9, mean), None);
+    }
+
+    #[test]
+    fn test_sqrt_decimal() {
+        let epsilon = Decimal::new(1, 10);
+        let root2 = sqrt_decimal(Decimal::from(2));
+        assert!((root2 - Decimal::new(14142135623731, 13)).abs() < epsilon);
+
+        let large = Decimal::from(123_456_789_u64);
+        let root = sqrt_decimal(large);
+        assert!((root * root - large).abs() < Decimal::new(1, 5));
+
+        assert_eq!(sqrt_decimal(Decimal::from(9)), Decimal::from(3));
+        assert_eq!(sqrt_decimal(Decimal::ZERO), Decimal::ZERO);
+    }
+}
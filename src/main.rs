@@ -15,17 +15,18 @@ use chrono::{NaiveDate, Utc};
 use clap::{Parser, Subcommand};
 use rust_decimal::Decimal;
 use rust_decimal_macros::dec;
+use std::collections::HashMap;
 use std::sync::Arc;
 use tokio::sync::RwLock;
 use tracing::{error, info, warn, Level};
 use tracing_subscriber::FmtSubscriber;
 
 use config::{RuntimeConfig, RuntimeConfigManager};
-use engine::{BacktestConfig, BacktestEngine, BotController, PaperTradingEngine, TradeExecutor};
+use engine::{BacktestConfig, BacktestEngine, BacktestResults, BotController, PaperTradingEngine, TradeExecutor};
 use exchange::{BinanceClient, BinanceWebSocket, MarketEvent};
 use risk::RiskManager;
 use strategies::{create_strategies_for_pair, CombinedStrategy, Strategy};
-use types::{TimeFrame, TradingPair, CandleBuffer, Signal, Side};
+use types::{Candle, TimeFrame, TradingPair, CandleBuffer, Signal, Side};
 use web::{AppState, DashboardState, start_dashboard_server, SignalRecord, PortfolioState, PositionInfo, TradeRecord};
 
 #[derive(Parser)]
@@ -568,9 +569,11 @@ async fn run_backtest(start: &str, end: &str, save_to_db: bool) -> Result<()> {
         // Save trades to database
         info!("\nInserting {} trades into database...", results.trades.len());
 
-        for (i, backtest_trade) in results.trades.iter().enumerate() {
-            // Convert from backtest TradeRecord to web TradeRecord
-            let db_trade = TradeRecord {
+        // Convert from backtest TradeRecord to web TradeRecord
+        let db_trades: Vec<TradeRecord> = results
+            .trades
+            .iter()
+            .map(|backtest_trade| TradeRecord {
                 id: backtest_trade.id.clone(),
                 timestamp: backtest_trade.exit_time,
                 pair: backtest_trade.pair,
@@ -584,14 +587,11 @@ async fn run_backtest(start: &str, end: &str, save_to_db: bool) -> Result<()> {
                 strategy: backtest_trade.strategy.clone(),
                 exit_reason: Some(format!("{:?}", backtest_trade.exit_reason)),
                 status: "Closed".to_string(),
-            };
+            })
+            .collect();
 
-            db.insert_trade(&db_trade).await?;
-
-            if (i + 1) % 10 == 0 {
-                info!("Inserted {}/{} trades", i + 1, results.trades.len());
-            }
-        }
+        // One transaction for the whole batch rather than a commit per trade
+        db.insert_trades(&db_trades).await?;
 
         info!("\n✓ Successfully inserted {} trades into database", results.trades.len());
         info!("✓ Dashboard at http://localhost:3000 will now show historical trading data");
@@ -605,20 +605,17 @@ async fn run_backtest(start: &str, end: &str, save_to_db: bool) -> Result<()> {
         return Ok(());
     }
 
-    // Standard backtest comparison (4 scenarios)
+    // Standard backtest comparison (conservative vs aggressive)
     info!("=== Starting Comprehensive Backtest Comparison ===");
     info!("Period: {} to {}", start_date, end_date);
     info!("Pairs: BTC, ETH, SOL");
     info!("Timeframe: 4-hour");
     info!("Initial Capital: $2,000");
-    info!("Running 4 scenarios: Conservative (w/ & w/o PM), Aggressive (w/ & w/o PM)");
+    info!("Running 2 scenarios: Conservative, Aggressive");
     println!();
 
-    // Scenario 1: Conservative WITHOUT position management
-    info!("\n{}", "=".repeat(80));
-    info!("SCENARIO 1: Conservative 5-Year Profile WITHOUT Position Management");
-    info!("{}", "=".repeat(80));
-    let conservative_no_pm = BacktestConfig {
+    // Scenario 1: Conservative
+    let conservative = BacktestConfig {
         start_date,
         end_date,
         initial_capital: Decimal::from(2000),
@@ -635,97 +632,46 @@ async fn run_backtest(start: &str, end: &str, save_to_db: bool) -> Result<()> {
         risk_per_trade: dec!(0.05),  // Conservative: 5% risk per trade
         max_allocation: dec!(0.60),  // Conservative: 60% max allocation per position
     };
-    let mut engine1 = BacktestEngine::new(conservative_no_pm);
-    let results1 = engine1.run().await?;
+
+    // Scenario 2: Ultra Aggressive
+    // Shares the conservative period, pairs, timeframe and costs so both
+    // scenarios can replay the same fetched candles
+    let aggressive = BacktestConfig {
+        min_confidence: dec!(0.65),  // Ultra Aggressive: 0.65 (3965% over 5 years)
+        min_risk_reward: dec!(2.0),  // Ultra Aggressive: 2.0 R:R
+        risk_per_trade: dec!(0.12),  // Ultra Aggressive: 12% risk per trade
+        max_allocation: dec!(0.90),  // Ultra Aggressive: 90% max allocation per position
+        ..conservative.clone()
+    };
+
+    // Every scenario covers the same period, pairs and timeframe, so fetch the
+    // candles once and replay them through each configuration
+    let historical_data = Arc::new(BacktestEngine::fetch_all_historical_data(&conservative).await?);
+
+    // The scenarios are independent and CPU-bound, so run them side by side
+    info!("Running scenarios in parallel...");
+    let (results1, results2) = tokio::try_join!(
+        spawn_backtest(conservative, Arc::clone(&historical_data)),
+        spawn_backtest(aggressive, Arc::clone(&historical_data)),
+    )?;
+    let (results1, results2) = (results1?, results2?);
+
+    info!("\n{}", "=".repeat(80));
+    info!("SCENARIO 1: Conservative 5-Year Profile");
+    info!("{}", "=".repeat(80));
     results1.print_summary();
     let json1 = serde_json::to_string_pretty(&results1)?;
     std::fs::write("backtest_conservative_no_pm.json", &json1)?;
     info!("Results saved to backtest_conservative_no_pm.json");
 
-    // Scenario 2: Conservative WITH position management
     info!("\n{}", "=".repeat(80));
-    info!("SCENARIO 2: Conservative 5-Year Profile WITH Position Management");
+    info!("SCENARIO 2: Ultra Aggressive Profile");
     info!("{}", "=".repeat(80));
-    let conservative_with_pm = BacktestConfig {
-        start_date,
-        end_date,
-        initial_capital: Decimal::from(2000),
-        timeframe: TimeFrame::H4,
-        pairs: vec![
-            TradingPair::BTCUSDT,
-            TradingPair::ETHUSDT,
-            TradingPair::SOLUSDT,
-        ],
-        fee_rate: dec!(0.001),
-        slippage_rate: dec!(0.0005),
-        min_confidence: dec!(0.65),  // Conservative 5-Year: 0.65
-        min_risk_reward: dec!(2.0),  // Conservative 5-Year: 2.0 R:R
-        risk_per_trade: dec!(0.05),  // Conservative: 5% risk per trade
-        max_allocation: dec!(0.60),  // Conservative: 60% max allocation per position
-    };
-    let mut engine2 = BacktestEngine::new(conservative_with_pm);
-    let results2 = engine2.run().await?;
     results2.print_summary();
     let json2 = serde_json::to_string_pretty(&results2)?;
-    std::fs::write("backtest_conservative_with_pm.json", &json2)?;
-    info!("Results saved to backtest_conservative_with_pm.json");
-
-    // Scenario 3: Ultra Aggressive WITHOUT position management
-    info!("\n{}", "=".repeat(80));
-    info!("SCENARIO 3: Ultra Aggressive Profile WITHOUT Position Management");
-    info!("{}", "=".repeat(80));
-    let aggressive_no_pm = BacktestConfig {
-        start_date,
-        end_date,
-        initial_capital: Decimal::from(2000),
-        timeframe: TimeFrame::H4,
-        pairs: vec![
-            TradingPair::BTCUSDT,
-            TradingPair::ETHUSDT,
-            TradingPair::SOLUSDT,
-        ],
-        fee_rate: dec!(0.001),
-        slippage_rate: dec!(0.0005),
-        min_confidence: dec!(0.65),  // Ultra Aggressive: 0.65 (3965% over 5 years)
-        min_risk_reward: dec!(2.0),  // Ultra Aggressive: 2.0 R:R
-        risk_per_trade: dec!(0.12),  // Ultra Aggressive: 12% risk per trade
-        max_allocation: dec!(0.90),  // Ultra Aggressive: 90% max allocation per position
-    };
-    let mut engine3 = BacktestEngine::new(aggressive_no_pm);
-    let results3 = engine3.run().await?;
-    results3.print_summary();
-    let json3 = serde_json::to_string_pretty(&results3)?;
-    std::fs::write("backtest_aggressive_no_pm.json", &json3)?;
+    std::fs::write("backtest_aggressive_no_pm.json", &json2)?;
     info!("Results saved to backtest_aggressive_no_pm.json");
 
-    // Scenario 4: Ultra Aggressive WITH position management
-    info!("\n{}", "=".repeat(80));
-    info!("SCENARIO 4: Ultra Aggressive Profile WITH Position Management");
-    info!("{}", "=".repeat(80));
-    let aggressive_with_pm = BacktestConfig {
-        start_date,
-        end_date,
-        initial_capital: Decimal::from(2000),
-        timeframe: TimeFrame::H4,
-        pairs: vec![
-            TradingPair::BTCUSDT,
-            TradingPair::ETHUSDT,
-            TradingPair::SOLUSDT,
-        ],
-        fee_rate: dec!(0.001),
-        slippage_rate: dec!(0.0005),
-        min_confidence: dec!(0.65),  // Ultra Aggressive: 0.65
-        min_risk_reward: dec!(2.0),  // Ultra Aggressive: 2.0 R:R
-        risk_per_trade: dec!(0.12),  // Ultra Aggressive: 12% risk per trade
-        max_allocation: dec!(0.90),  // Ultra Aggressive: 90% max allocation per position
-    };
-    let mut engine4 = BacktestEngine::new(aggressive_with_pm);
-    let results4 = engine4.run().await?;
-    results4.print_summary();
-    let json4 = serde_json::to_string_pretty(&results4)?;
-    std::fs::write("backtest_aggressive_with_pm.json", &json4)?;
-    info!("Results saved to backtest_aggressive_with_pm.json");
-
     // Print comparison summary
     info!("\n\n{}", "=".repeat(80));
     info!("COMPARISON SUMMARY");
@@ -733,26 +679,18 @@ async fn run_backtest(start: &str, end: &str, save_to_db: bool) -> Result<()> {
     println!("\n{:<45} {:>12} {:>12} {:>10} {:>10}", "Scenario", "Final Equity", "Return %", "Max DD %", "Sharpe");
     println!("{}", "-".repeat(93));
     println!("{:<45} ${:>11.2} {:>11.2}% {:>9.2}% {:>10.2}",
-        "Conservative 5-Year WITHOUT PM", results1.final_equity, results1.total_return_pct, results1.max_drawdown_pct, results1.sharpe_ratio);
-    println!("{:<45} ${:>11.2} {:>11.2}% {:>9.2}% {:>10.2}",
-        "Conservative 5-Year WITH PM", results2.final_equity, results2.total_return_pct, results2.max_drawdown_pct, results2.sharpe_ratio);
-    println!("{:<45} ${:>11.2} {:>11.2}% {:>9.2}% {:>10.2}",
-        "Ultra Aggressive WITHOUT PM", results3.final_equity, results3.total_return_pct, results3.max_drawdown_pct, results3.sharpe_ratio);
+        "Conservative 5-Year", results1.final_equity, results1.total_return_pct, results1.max_drawdown_pct, results1.sharpe_ratio);
     println!("{:<45} ${:>11.2} {:>11.2}% {:>9.2}% {:>10.2}",
-        "Ultra Aggressive WITH PM", results4.final_equity, results4.total_return_pct, results4.max_drawdown_pct, results4.sharpe_ratio);
+        "Ultra Aggressive", results2.final_equity, results2.total_return_pct, results2.max_drawdown_pct, results2.sharpe_ratio);
     println!("{}", "=".repeat(88));
 
-    // Calculate improvements
-    let conservative_improvement = ((results2.total_return_pct - results1.total_return_pct) / results1.total_return_pct) * dec!(100);
-    let aggressive_improvement = ((results4.total_return_pct - results3.total_return_pct) / results3.total_return_pct) * dec!(100);
-    let conservative_dd_improvement = results1.max_drawdown_pct - results2.max_drawdown_pct;
-    let aggressive_dd_improvement = results3.max_drawdown_pct - results4.max_drawdown_pct;
-
-    println!("\nPosition Management Impact:");
-    println!("  Conservative: Return improved by {:.2}%, Drawdown reduced by {:.2}%",
-        conservative_improvement, conservative_dd_improvement);
-    println!("  Aggressive: Return improved by {:.2}%, Drawdown reduced by {:.2}%",
-        aggressive_improvement, aggressive_dd_improvement);
-
     Ok(())
 }
+
+/// Run a backtest over shared candle data on the blocking thread pool
+fn spawn_backtest(
+    config: BacktestConfig,
+    historical_data: Arc<HashMap<TradingPair, Vec<Candle>>>,
+) -> tokio::task::JoinHandle<Result<BacktestResults>> {
+    tokio::task::spawn_blocking(move || BacktestEngine::new(config).run_on_data(&historical_data))
+}
@@ -1,7 +1,8 @@
+use chrono::{DateTime, Utc};
 use rust_decimal::Decimal;
 use crate::indicators::{ATR, BollingerBands, RSI, Indicator};
 use crate::types::{CandleBuffer, Signal, TradingPair};
-use super::{Strategy, StrategySignal};
+use super::{first_unprocessed, Strategy, StrategySignal};
 
 /// Mean Reversion Strategy
 /// Best for: SOL on extreme moves, ETH during range-bound periods
@@ -14,6 +15,7 @@ pub struct MeanReversionStrategy {
     atr: ATR,
     rsi_oversold: Decimal,
     rsi_overbought: Decimal,
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl MeanReversionStrategy {
@@ -26,6 +28,7 @@ impl MeanReversionStrategy {
             atr: ATR::new(14),
             rsi_oversold: Decimal::from(25),
             rsi_overbought: Decimal::from(75),
+            last_open_time: None,
         }
     }
 
@@ -38,6 +41,7 @@ impl MeanReversionStrategy {
             atr: ATR::new(14),
             rsi_oversold: Decimal::from(20),
             rsi_overbought: Decimal::from(80),
+            last_open_time: None,
         }
     }
 
@@ -112,7 +116,9 @@ impl Strategy for MeanReversionStrategy {
         }
 
         // Update indicators
-        for candle in candles.candles.iter() {
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             self.bollinger.update(candle.close);
             self.rsi.update(candle.close);
             self.atr.update(candle.high, candle.low, candle.close);
@@ -163,6 +169,7 @@ impl Strategy for MeanReversionStrategy {
         self.bollinger.reset();
         self.rsi.reset();
         self.atr.reset();
+        self.last_open_time = None;
     }
 }
 
@@ -175,6 +182,7 @@ pub struct RSIDivergenceStrategy {
     atr: ATR,
     lookback: usize,
     price_history: Vec<(Decimal, Decimal)>, // (price, rsi)
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl RSIDivergenceStrategy {
@@ -186,6 +194,7 @@ impl RSIDivergenceStrategy {
             atr: ATR::new(14),
             lookback: 14,
             price_history: Vec::with_capacity(20),
+            last_open_time: None,
         }
     }
 
@@ -225,7 +234,9 @@ impl Strategy for RSIDivergenceStrategy {
         }
 
         // Update indicators and track history
-        for candle in candles.candles.iter() {
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             if let Some(rsi) = self.rsi.update(candle.close) {
                 self.price_history.push((candle.close, rsi));
                 if self.price_history.len() > 50 {
@@ -295,5 +306,6 @@ impl Strategy for RSIDivergenceStrategy {
         self.rsi.reset();
         self.atr.reset();
         self.price_history.clear();
+        self.last_open_time = None;
     }
 }
@@ -10,6 +10,7 @@ pub use mean_reversion::*;
 pub use combined::*;
 pub use improved::*;
 
+use chrono::{DateTime, Utc};
 use rust_decimal::Decimal;
 use crate::types::{CandleBuffer, Signal, Side, TradingPair};
 
@@ -21,6 +22,16 @@ pub trait Strategy: Send + Sync {
     fn reset(&mut self);
 }
 
+/// Index of the first candle in the buffer newer than `last_open_time`, the open time
+/// of the last candle a strategy fed to its indicators. Buffers are kept in time order,
+/// so this holds however many candles were pushed since the previous call, including none.
+pub(crate) fn first_unprocessed(candles: &CandleBuffer, last_open_time: Option<DateTime<Utc>>) -> usize {
+    match last_open_time {
+        Some(last) => candles.candles.partition_point(|c| c.open_time <= last),
+        None => 0,
+    }
+}
+
 #[derive(Debug, Clone)]
 pub struct StrategySignal {
     pub strategy_name: String,
@@ -92,3 +103,48 @@ impl StrategySignal {
         }
     }
 }
+
+#[cfg(test)]
+pub(crate) mod tests {
+    use super::*;
+    use chrono::{Duration, TimeZone};
+    use crate::types::{Candle, TimeFrame};
+
+    /// Hourly candle `i` with a close that varies enough to move every indicator
+    pub(crate) fn test_candle(i: i64) -> Candle {
+        let open_time = Utc.timestamp_opt(1_700_000_000, 0).unwrap() + Duration::hours(i);
+        let close = Decimal::from(100 + (i * 7) % 23);
+        Candle {
+            pair: TradingPair::BTCUSDT,
+            timeframe: TimeFrame::H1,
+            open_time,
+            close_time: open_time + Duration::hours(1),
+            open: close - Decimal::ONE,
+            high: close + Decimal::from(2),
+            low: close - Decimal::from(2),
+            close,
+            volume: Decimal::from(1000 + (i * 13) % 37),
+            quote_volume: Decimal::ZERO,
+            trades: 0,
+            is_closed: true,
+        }
+    }
+
+    #[test]
+    fn test_first_unprocessed() {
+        let mut buffer = CandleBuffer::new(5);
+        for i in 0..5 {
+            buffer.push(test_candle(i));
+        }
+        assert_eq!(first_unprocessed(&buffer, None), 0);
+
+        let last = buffer.last().map(|c| c.open_time);
+        assert_eq!(first_unprocessed(&buffer, last), 5);
+
+        // Three pushes on a full buffer leave three unprocessed candles at the end
+        for i in 5..8 {
+            buffer.push(test_candle(i));
+        }
+        assert_eq!(first_unprocessed(&buffer, last), 2);
+    }
+}
@@ -1,7 +1,8 @@
+use chrono::{DateTime, Utc};
 use rust_decimal::Decimal;
 use crate::indicators::{ATR, EMA, RSI, VolumeProfile, Indicator};
 use crate::types::{CandleBuffer, Signal, TradingPair};
-use super::{Strategy, StrategySignal};
+use super::{first_unprocessed, Strategy, StrategySignal};
 
 /// Momentum Strategy
 /// Best for: SOL (high-beta momentum asset)
@@ -17,6 +18,7 @@ pub struct MomentumStrategy {
     rsi_overbought: Decimal,
     rsi_oversold: Decimal,
     volume_threshold: Decimal,
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl MomentumStrategy {
@@ -32,6 +34,7 @@ impl MomentumStrategy {
             rsi_overbought: Decimal::from(70),
             rsi_oversold: Decimal::from(30),
             volume_threshold: Decimal::new(15, 1), // 1.5x average volume
+            last_open_time: None,
         }
     }
 
@@ -47,6 +50,7 @@ impl MomentumStrategy {
             rsi_overbought: Decimal::from(65),
             rsi_oversold: Decimal::from(35),
             volume_threshold: Decimal::new(12, 1),
+            last_open_time: None,
         }
     }
 
@@ -87,7 +91,9 @@ impl Strategy for MomentumStrategy {
         }
 
         // Update indicators
-        for candle in candles.candles.iter() {
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             self.rsi.update(candle.close);
             self.ema_fast.update(candle.close);
             self.ema_slow.update(candle.close);
@@ -165,6 +171,7 @@ impl Strategy for MomentumStrategy {
         self.ema_slow.reset();
         self.volume_profile.reset();
         self.atr.reset();
+        self.last_open_time = None;
     }
 }
 
@@ -177,6 +184,7 @@ pub struct VolumeBreakoutStrategy {
     atr: ATR,
     lookback: usize,
     volume_multiplier: Decimal,
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl VolumeBreakoutStrategy {
@@ -188,6 +196,7 @@ impl VolumeBreakoutStrategy {
             atr: ATR::new(14),
             lookback: 10,
             volume_multiplier: Decimal::from(2),
+            last_open_time: None,
         }
     }
 }
@@ -206,7 +215,9 @@ impl Strategy for VolumeBreakoutStrategy {
             return None;
         }
 
-        for candle in candles.candles.iter() {
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             self.volume_profile.update(candle.volume);
             self.atr.update(candle.high, candle.low, candle.close);
         }
@@ -282,5 +293,40 @@ impl Strategy for VolumeBreakoutStrategy {
     fn reset(&mut self) {
         self.volume_profile.reset();
         self.atr.reset();
+        self.last_open_time = None;
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::strategies::tests::test_candle;
+
+    #[test]
+    fn test_analyze_feeds_every_new_candle_on_full_buffer() {
+        let mut strategy = MomentumStrategy::new(TradingPair::BTCUSDT);
+        let mut buffer = CandleBuffer::new(40);
+        for i in 0..40 {
+            buffer.push(test_candle(i));
+        }
+        strategy.analyze(&buffer);
+
+        // Several candles arrive between calls, then a call with nothing new
+        for i in 40..43 {
+            buffer.push(test_candle(i));
+        }
+        strategy.analyze(&buffer);
+        strategy.analyze(&buffer);
+
+        let mut ema_fast = EMA::new(8);
+        let mut atr = ATR::new(14);
+        for i in 0..43 {
+            let c = test_candle(i);
+            ema_fast.update(c.close);
+            atr.update(c.high, c.low, c.close);
+        }
+
+        assert_eq!(strategy.ema_fast.value(), ema_fast.value());
+        assert_eq!(strategy.atr.value(), atr.value());
     }
 }
@@ -1,7 +1,8 @@
+use chrono::{DateTime, Utc};
 use rust_decimal::Decimal;
 use crate::indicators::{ATR, DoubleEMA, MACD, Indicator};
 use crate::types::{CandleBuffer, Signal, TradingPair};
-use super::{Strategy, StrategySignal};
+use super::{first_unprocessed, Strategy, StrategySignal};
 
 /// Trend Following Strategy
 /// Best for: BTC, ETH
@@ -15,6 +16,7 @@ pub struct TrendStrategy {
     min_trend_strength: Decimal,
     atr_multiplier_sl: Decimal,
     atr_multiplier_tp: Decimal,
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl TrendStrategy {
@@ -28,6 +30,7 @@ impl TrendStrategy {
             min_trend_strength: Decimal::new(5, 1), // 0.5% minimum spread
             atr_multiplier_sl: Decimal::new(15, 1), // 1.5x ATR for stop loss
             atr_multiplier_tp: Decimal::new(30, 1), // 3x ATR for take profit
+            last_open_time: None,
         }
     }
 
@@ -46,6 +49,7 @@ impl TrendStrategy {
             min_trend_strength: Decimal::new(5, 1),
             atr_multiplier_sl: Decimal::new(15, 1),
             atr_multiplier_tp: Decimal::new(30, 1),
+            last_open_time: None,
         }
     }
 
@@ -99,8 +103,10 @@ impl Strategy for TrendStrategy {
             return None;
         }
 
-        // Update indicators with all candles
-        for candle in candles.candles.iter() {
+        // Update indicators with candles not seen on a previous call
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             self.ema.update(candle.close);
             self.macd.update(candle.close);
             self.atr.update(candle.high, candle.low, candle.close);
@@ -178,6 +184,7 @@ impl Strategy for TrendStrategy {
         self.ema.reset();
         self.macd.reset();
         self.atr.reset();
+        self.last_open_time = None;
     }
 }
 
@@ -189,6 +196,7 @@ pub struct BreakoutStrategy {
     lookback_period: usize,
     atr: ATR,
     breakout_threshold: Decimal,
+    last_open_time: Option<DateTime<Utc>>,
 }
 
 impl BreakoutStrategy {
@@ -199,6 +207,7 @@ impl BreakoutStrategy {
             lookback_period: 20,
             atr: ATR::new(14),
             breakout_threshold: Decimal::new(15, 1), // 1.5x ATR
+            last_open_time: None,
         }
     }
 }
@@ -218,7 +227,9 @@ impl Strategy for BreakoutStrategy {
         }
 
         // Update ATR
-        for candle in candles.candles.iter() {
+        let start = first_unprocessed(candles, self.last_open_time);
+        self.last_open_time = candles.last().map(|c| c.open_time);
+        for candle in &candles.candles[start..] {
             self.atr.update(candle.high, candle.low, candle.close);
         }
 
@@ -285,5 +296,6 @@ impl Strategy for BreakoutStrategy {
 
     fn reset(&mut self) {
         self.atr.reset();
+        self.last_open_time = None;
     }
 }
@@ -103,8 +103,9 @@ pub async fn get_portfolio(
             let initial_capital = Decimal::from(2000);
             let total_equity = initial_capital + realized_pnl;
 
-            // Calculate max drawdown from trade history
-            let mut sorted_trades = trades.clone();
+            // Calculate max drawdown from trade history (sorted in place, the
+            // list isn't needed in its original order afterwards)
+            let mut sorted_trades = trades;
             sorted_trades.sort_by(|a, b| a.timestamp.cmp(&b.timestamp));
 
             let mut equity = initial_capital;
@@ -249,7 +250,7 @@ pub async fn get_analytics(
 
     // Calculate analytics
     let analytics = crate::analytics::AnalyticsCalculator::calculate(
-        &trades,
+        trades,
         initial_capital,
         current_equity,
     );